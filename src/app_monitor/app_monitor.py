@@ -1,8 +1,9 @@
 import asyncio
 from copy import deepcopy
 from datetime import datetime
+import os
 import sys
-import asyncio
+import time
 import json
 from flask_socketio import SocketIO
 
@@ -24,31 +25,66 @@ class MonitorManager:
     def __init__(self, log_to_file_enabled=False):
         self.elements = []  # Store elements as a list to maintain their order
         self.buffer = []  # The off-screen buffer where all elements are written
+        # element_id -> element (or owning MonitorGroup) for O(1) updates.
+        self._element_map = {}
         self.logger = None  # CSV logger not yet initialized
         self.log_to_file_enabled = log_to_file_enabled
 
     def add_element(self, element):
         """Add a monitor element to the manager."""
         self.elements.append(element)
+        self._register(element)
 
     def add_element_group(self, group_id, elements):
         """Add a group of elements to the manager by creating a MonitorGroup."""
         # Automatically set hierarchical IDs based on the group_id
         group = MonitorGroup(group_id=group_id, elements=elements, border=True)
         self.elements.append(group)  # Add the whole group as one element
+        self._register(group)
+
+    def _register(self, element):
+        """Index an element (or a group's members) for O(1) update lookup."""
+        if isinstance(element, MonitorGroup):
+            for element_id in element.elements:
+                self._element_map[element_id] = element
+        else:
+            self._element_map[element.element_id] = element
 
     def update(self, element_id, *args):
         """Update an element or an element within a group based on its full hierarchical ID."""
+        target = self._element_map.get(element_id)
+        if target is not None:
+            if isinstance(target, MonitorGroup):
+                target.update_element(element_id, *args)
+            else:
+                target.update(*args)
+            return
+        # Fallback scan covers elements added to a group after it was
+        # registered; re-index on a hit so the next update is O(1).
         for element in self.elements:
             if isinstance(element, MonitorGroup):
-                # Check if the element_id is within the group's elements
                 if element_id in element.elements:
+                    self._element_map[element_id] = element
                     element.update_element(element_id, *args)
                     break
             elif element.element_id == element_id:
+                self._element_map[element_id] = element
                 element.update(*args)
                 break
 
+    def update_many(self, items):
+        """Update several elements in a single call.
+
+        Args:
+            items: Mapping of element_id to value, or an iterable of
+                (element_id, value) pairs.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        update = self.update
+        for element_id, value in items:
+            update(element_id, value)
+
     def generate_element_id_map(self):
         """Generate a list of all element IDs in the monitor manager."""
         element_count = 0
@@ -108,6 +144,52 @@ class MonitorManager:
 
 class TerminalManager(MonitorManager):
 
+    def __init__(
+        self,
+        log_to_file_enabled=False,
+        min_redraw_interval=1 / 30,
+        banner=None,
+        banner_format=None,
+    ):
+        """
+        :param min_redraw_interval: Minimum seconds between repaints;
+            redraws arriving faster than this coalesce into one frame.
+        :param banner: Optional static text shown above the elements.
+        :param banner_format: Optional TextFormat applied to the banner.
+        """
+        super().__init__(log_to_file_enabled)
+        # The banner is immutable, so it is rendered (and styled) exactly
+        # once here; each frame just prepends the cached lines.
+        if banner is not None:
+            rendered = banner_format.format_text(banner) if banner_format else banner
+            self._banner_lines = rendered.split("\n")
+        else:
+            self._banner_lines = []
+        self.show_banner = banner is not None
+        # Every frame starts with the same bytes: cursor home plus the
+        # erase-coded banner block, folded into one cached prefix.
+        self._frame_prefix = "\033[H"
+        if self._banner_lines:
+            self._frame_prefix += "\033[K\n".join(self._banner_lines) + "\033[K\n"
+        self._dirty = True
+        self._min_redraw_interval = min_redraw_interval
+        self._last_render = 0.0
+        # Writing encoded frames straight to the fd skips the TextIOWrapper
+        # encode and lock per repaint; None falls back to sys.stdout (e.g.
+        # when stdout is replaced by a non-file object under test capture).
+        try:
+            self._stdout_fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._stdout_fd = None
+        # Lines painted by the previous frame; a shrinking frame blanks
+        # the leftover tail instead of clearing the whole screen.
+        self._last_line_count = 0
+
+    def update(self, element_id, *args):
+        """Update an element and mark the screen as needing a repaint."""
+        super().update(element_id, *args)
+        self._dirty = True
+
     def update_screen_buffer(self):
         """Construct the full screen content in a buffer"""
         self.buffer = []  # Clear the buffer for the new frame
@@ -118,11 +200,47 @@ class TerminalManager(MonitorManager):
                     element.display()
                 )  # Add each element's display to the buffer
 
-    def update_screen(self):
-        """Clear the terminal and write the buffer contents to the screen."""
-        self.clear_monitor()
-        # Print the entire buffered content at once
-        sys.stdout.write("\n".join(self.buffer))
+    def update_screen(self, force=False):
+        """Repaint the terminal if anything changed since the last frame.
+
+        Clean frames and repaints arriving inside the minimum interval
+        are skipped entirely; pass force=True to repaint regardless.
+        """
+        now = time.monotonic()
+        if not force:
+            if not self._dirty:
+                return
+            if now - self._last_render < self._min_redraw_interval:
+                return
+        self._dirty = False
+        self._last_render = now
+        # Overwrite in place: cursor home plus erase-to-end-of-line per
+        # line avoids the flicker of a full \033[2J clear, and any tail
+        # left over from a taller previous frame is blanked explicitly.
+        # One write still carries the whole frame, so a refresh costs a
+        # single syscall and can never partially render.
+        lines = []
+        for chunk in self.buffer:
+            lines.extend(chunk.split("\n"))
+        show_banner = self.show_banner
+        prefix = self._frame_prefix if show_banner else "\033[H"
+        frame = prefix + "\033[K\n".join(lines) + "\033[K"
+        total = len(lines) + (len(self._banner_lines) if show_banner else 0)
+        extra = self._last_line_count - total
+        if extra > 0:
+            frame += "\n\033[K" * extra
+        self._last_line_count = total
+        if force:
+            # Forced repaints start from a clean screen.
+            frame = "\033[2J" + frame
+        fd = self._stdout_fd
+        if fd is None or sys.stdout is not sys.__stdout__:
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+            return
+        data = frame.encode("utf-8")
+        while data:
+            data = data[os.write(fd, data):]
 
     def clear_monitor(self):
         """Clear the monitor screen."""
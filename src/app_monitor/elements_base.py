@@ -1,6 +1,11 @@
-from collections import OrderedDict
+from collections import deque
 from copy import deepcopy
+from dataclasses import astuple
 from datetime import datetime
+from functools import lru_cache
+import shutil
+import signal
+import numpy as np
 from tabulate import tabulate
 from app_monitor.text_formatter import ANSITextFormatter
 from app_monitor.logger import logger
@@ -8,6 +13,85 @@ from app_monitor.logger import logger
 # Maximum width for monitor elements
 MAX_MONITOR_WIDTH = 60
 
+# Cached terminal width; None means "query again on next read".
+_term_width = None
+_winch_installed = False
+
+
+def _invalidate_term_width(signum=None, frame=None):
+    global _term_width
+    _term_width = None
+
+
+def _install_winch_handler():
+    """Install the SIGWINCH cache invalidator, chaining any prior handler.
+
+    The previous handler is called after the cache is invalidated, so a
+    host application that owns SIGWINCH (curses, prompt_toolkit, ...)
+    keeps its resize handling intact.
+    """
+    previous = signal.getsignal(signal.SIGWINCH)
+
+    def _on_winch(signum, frame):
+        _invalidate_term_width()
+        if callable(previous):
+            previous(signum, frame)
+
+    signal.signal(signal.SIGWINCH, _on_winch)
+
+
+def get_terminal_width():
+    """Return the terminal width in columns, cached between resizes.
+
+    shutil.get_terminal_size costs an ioctl per call, so the value is
+    cached and only re-read after SIGWINCH invalidates it (or always on
+    platforms without SIGWINCH, where resizes are rare anyway). The
+    handler is installed lazily on first use rather than at import.
+    """
+    global _term_width, _winch_installed
+    if not _winch_installed:
+        _winch_installed = True
+        try:
+            _install_winch_handler()
+        except (AttributeError, ValueError):
+            # No SIGWINCH on this platform, or not the main thread; the
+            # first reading simply stays cached.
+            pass
+    if _term_width is None:
+        _term_width = shutil.get_terminal_size().columns
+    return _term_width
+
+# Shared cache of bound formatters, keyed by the format spec, so elements
+# that use identical formatting reuse one callable instead of each holding
+# their own.
+_format_cache = {}
+
+
+def _bind_format(text_format):
+    """Return a shared bound format_text callable for a TextFormat spec."""
+    if text_format is None:
+        return None
+    try:
+        key = (type(text_format), astuple(text_format))
+    except TypeError:
+        # Not a dataclass (or unhashable fields); bind without sharing.
+        return text_format.format_text
+    formatter = _format_cache.get(key)
+    if formatter is None:
+        formatter = text_format.format_text
+        _format_cache[key] = formatter
+    return formatter
+
+
+@lru_cache(maxsize=None)
+def _bar_strings(width):
+    """All fill states for a progress bar of `width`, indexed by fill.
+
+    A bar of fixed width has only width+1 distinct renderings, so the
+    per-frame string multiplication collapses to a list index.
+    """
+    return [("█" * i + "░" * (width - i)) for i in range(width + 1)]
+
 
 # ID generator to create unique IDs for monitor elements
 def id_generator(prefix="element"):
@@ -34,7 +118,9 @@ class MonitorElement:
         """
         self.element_id = element_id or self.get_unique_id()
         self.border = border
-        self.width = MAX_MONITOR_WIDTH if width is None else width
+        if width is None:
+            width = min(MAX_MONITOR_WIDTH, get_terminal_width())
+        self.width = width
         self.enabled = enabled
  
 
@@ -54,7 +140,10 @@ class MonitorElement:
         """Wrap content in a border if `self.border` is True."""
         if not self.border:
             return content
-        lines = content.split("\n")
+        return self._border_join(content.split("\n"))
+
+    def _border_join(self, lines):
+        """Join pre-split lines into a single bordered block."""
         width = min(max(len(line) for line in lines) + 4, self.width)
         border_top = "+" + "-" * (width - 2) + "+"
         bordered_content = [f"| {line.ljust(width - 4)} |" for line in lines]
@@ -88,6 +177,9 @@ class MonitorGroup(MonitorElement):
         super().__init__(element_id=group_id, border=border, width=width, enabled=enabled)
         self.group_id = group_id
         self.elements = self.construct_elements(elements)
+        # Parallel list of elements in insertion order; list iteration is
+        # cheaper than dict-value traversal in the per-frame display loop.
+        self._ordered = list(self.elements.values())
 
     def construct_elements(self, elements=None):
         """
@@ -116,6 +208,7 @@ class MonitorGroup(MonitorElement):
         """
         element.element_id = f"{self.group_id}.{element_name}"
         self.elements[element.element_id] = element
+        self._ordered.append(element)
 
     def update_element(self, element_id, *args, **kwargs):
         """
@@ -129,15 +222,20 @@ class MonitorGroup(MonitorElement):
 
     def display(self):
         """Render the group with its elements."""
-        element_displays = "\n".join(
-            element.display() for element in self.elements.values()
-        )
-        return self.add_border(element_displays) if self.border else element_displays
+        if not self.border:
+            return "\n".join(element.display() for element in self._ordered)
+        # Collect lines directly so the border pass doesn't re-split a
+        # string that was only just joined.
+        lines = []
+        extend = lines.extend
+        for element in self._ordered:
+            extend(element.display().split("\n"))
+        return self._border_join(lines)
 
     def get_height(self):
         """Calculate total height including borders and contained elements."""
         element_heights = sum(
-            element.get_height() for element in self.elements.values()
+            element.get_height() for element in self._ordered
         )
         return element_heights + 2 if self.border else element_heights
 
@@ -171,6 +269,12 @@ class TextElement(MonitorElement):
         self.text = str(text or "")
         self.static_text = static_text
         self.text_format = text_format
+        # Bind the formatter once so display() avoids per-frame dispatch.
+        self._format_text = _bind_format(text_format)
+        # One-deep render memo; keyed on the text so unchanged frames are a
+        # single comparison instead of a rebuild-and-format.
+        self._last_key = None
+        self._last_render = None
 
     def update(self, text):
         """Update the text element."""
@@ -178,10 +282,14 @@ class TextElement(MonitorElement):
 
     def display(self):
         """Render the text element for display."""
+        key = (self.static_text, self.text)
+        if key == self._last_key:
+            return self._last_render
         full_text = (self.static_text or "") + self.text
-        return (
-            self.text_format.format_text(full_text) if self.text_format else full_text
-        )
+        rendered = self._format_text(full_text) if self._format_text else full_text
+        self._last_key = key
+        self._last_render = rendered
+        return rendered
 
     def get_height(self):
         """Calculate the number of lines the text occupies."""
@@ -228,8 +336,16 @@ class ProgressBar(MonitorElement):
         self.label = label
         self.bar_format = bar_format
         self.text_format = text_format
+        self._format_bar = _bind_format(bar_format)
+        self._format_text = _bind_format(text_format)
         self.display_value = display_value
         self.max_label_length = max_label_length or 10
+        # Static per-frame pieces: bound format closure (the spec string
+        # is parsed once, not per call) and the padded label.
+        self._pct_fmt = "{:.1f}%".format
+        self._padded_label = self.label.ljust(self.max_label_length)
+        # total_steps is fixed, so the per-render divide becomes a multiply.
+        self._inv_total_steps = 1.0 / total_steps
 
     def update(self, value, display_value=None):
         """Update the progress bar with a new value."""
@@ -240,18 +356,18 @@ class ProgressBar(MonitorElement):
 
     def display(self):
         """Render the progress bar for display."""
-        progress_percentage = self.current_step / self.total_steps
-        display_value = (
-            self.text_format.format_text(f"{progress_percentage * 100:.1f}%")
-            if self.text_format
-            else f"{progress_percentage * 100:.1f}%"
-        )
+        progress_percentage = self.current_step * self._inv_total_steps
+        display_value = self._pct_fmt(progress_percentage * 100)
+        if self._format_text:
+            display_value = self._format_text(display_value)
         bar_width = self.width - self.max_label_length - len(display_value) - 6
-        filled_length = int(bar_width * progress_percentage)
-        bar = "█" * filled_length + "░" * (bar_width - filled_length)
-        formatted_bar = self.bar_format.format_text(bar) if self.bar_format else bar
-        padded_label = self.label.ljust(self.max_label_length)
-        return f"{padded_label} [{formatted_bar}] {display_value}"
+        if bar_width > 0:
+            filled_length = min(bar_width, max(0, int(bar_width * progress_percentage)))
+            bar = _bar_strings(bar_width)[filled_length]
+        else:
+            bar = ""
+        formatted_bar = self._format_bar(bar) if self._format_bar else bar
+        return f"{self._padded_label} [{formatted_bar}] {display_value}"
 
     def get_height(self):
         """Progress bar occupies one line."""
@@ -313,6 +429,8 @@ class RangeBar(MonitorElement):
         self.label = label
         self.bar_format = bar_format
         self.text_format = text_format
+        self._format_bar = _bind_format(bar_format)
+        self._format_text = _bind_format(text_format)
         self.display_value = display_value
         self.max_label_length = max_label_length or 10
         self.max_display_length = max_display_length or 6
@@ -321,6 +439,12 @@ class RangeBar(MonitorElement):
         self.unit = unit or ""
         self.scale = scale
         self.digits = digits
+        # Static per-frame pieces, mirroring ProgressBar: the value spec
+        # is parsed once into a bound closure, the label padded once.
+        self._value_fmt = f"{{:>{self.max_display_length}.{self.digits}f}}".format
+        self._padded_label = self.label.ljust(self.max_label_length)
+        # The range is fixed, so the per-render divide becomes a multiply.
+        self._inv_span = 1.0 / (max_value - min_value)
 
     def update(self, value, display_value=None):
         """Update the range bar with a new value."""
@@ -333,30 +457,29 @@ class RangeBar(MonitorElement):
 
     def display(self):
         """Render the range bar for display."""
-        progress_ratio = (self.current_value - self.min_value) / (
-            self.max_value - self.min_value
-        )
-        numeric_value = (
-            f"{self.current_value:>{self.max_display_length}.{self.digits}f}"
-        )
+        progress_ratio = (self.current_value - self.min_value) * self._inv_span
+        numeric_value = self._value_fmt(self.current_value)
         full_display_value = f"{numeric_value} {self.unit}".ljust(
             self.max_display_length + len(self.unit)
         )
         display_value = (
-            self.text_format.format_text(full_display_value)
-            if self.text_format
+            self._format_text(full_display_value)
+            if self._format_text
             else full_display_value
         )
         bar_width = self.width - self.max_label_length - self.max_display_length - 13
-        marker_position = min(int(bar_width * progress_ratio), bar_width - 1)
-        bar = (
-            self.range_trace * marker_position
-            + self.marker_trace
-            + self.range_trace * (bar_width - marker_position - 1)
-        )
-        formatted_bar = self.bar_format.format_text(bar) if self.bar_format else bar
-        padded_label = self.label.ljust(self.max_label_length)
-        return f"{padded_label} [{formatted_bar}] {display_value}"
+        if bar_width > 0:
+            marker_position = min(int(bar_width * progress_ratio), bar_width - 1)
+            # Build the bar in a single allocation: write the marker into a
+            # repeated-trace buffer instead of concatenating three substrings.
+            trace = [self.range_trace] * bar_width
+            trace[marker_position] = self.marker_trace
+            bar = "".join(trace)
+        else:
+            # Too narrow for a trace; just the marker, as before.
+            bar = self.marker_trace
+        formatted_bar = self._format_bar(bar) if self._format_bar else bar
+        return f"{self._padded_label} [{formatted_bar}] {display_value}"
 
     def get_height(self):
         """Range bar occupies one line."""
@@ -383,6 +506,7 @@ class Table(MonitorElement):
         header_format=None,
         column_format=None,
         cell_format=None,
+        dtype=None,
         width=MAX_MONITOR_WIDTH,
         enabled=True,
     ):
@@ -397,22 +521,136 @@ class Table(MonitorElement):
             header_format (Callable): Formatting function for headers.
             column_format (Callable): Formatting function for left column.
             cell_format (Callable): Formatting function for data cells.
+            dtype: Optional numeric NumPy dtype for the cell data. Purely
+                numeric tables stored as e.g. float32 are far more compact
+                than the default object array.
         """
         super().__init__(element_id, width=width, enabled=enabled)
         self.headers = headers
         self.variables = variables
-        self.data = {var: [0] * len(headers) for var in variables}
+        self._var_index = {var: i for i, var in enumerate(variables)}
+        self._header_index = {header: i for i, header in enumerate(headers)}
+        # Contiguous 2D array keeps row scans cache-friendly and allows
+        # vectorized bulk updates via fancy indexing. A numeric dtype packs
+        # cells unboxed; the object fallback supports mixed-type tables.
+        if dtype is not None:
+            self._data = np.zeros((len(variables), len(headers)), dtype=dtype)
+        else:
+            self._data = np.empty((len(variables), len(headers)), dtype=object)
+            self._data[:] = 0
+        self.dtype = dtype
         self.data_column_width = data_column_width
         self.left_column_width = left_column_width
         self.header_format = header_format
         self.column_format = column_format
         self.cell_format = cell_format
+        self._format_header = _bind_format(header_format)
+        self._format_column = _bind_format(column_format)
+        self._format_cell = _bind_format(cell_format)
+        # Headers and row labels never change after construction, so their
+        # truncated, padded and styled renderings are computed once here
+        # instead of on every frame.
+        centered_headers = [
+            self._truncate_or_pad(header, data_column_width) for header in headers
+        ]
+        if self._format_header:
+            centered_headers = [
+                self._format_header(header) for header in centered_headers
+            ]
+        # Assemble the header row directly: the cells are already padded
+        # (and possibly styled), and re-running _truncate_or_pad on styled
+        # text would truncate mid-escape-sequence.
+        left_header = (
+            self._truncate_or_pad("", left_column_width) if left_column_width else ""
+        )
+        self._formatted_headers = [left_header] + centered_headers
+        row_labels = [
+            self._truncate_or_pad(var, left_column_width) if left_column_width else var
+            for var in variables
+        ]
+        if self._format_column:
+            row_labels = [self._format_column(label) for label in row_labels]
+        self._formatted_var_col = row_labels
+        # Rendered cell strings, refreshed only when a cell changes;
+        # display() then just assembles rows from precomputed pieces.
+        zero_cell = self._render_cell(self._data[0, 0] if len(variables) else 0)
+        self._cells = [[zero_cell] * len(headers) for _ in variables]
+        # Specialized fancy-grid renderer: the format is fixed at
+        # construction, so the border lines and header row are prebuilt
+        # and each frame only assembles the cell rows. Styled tables go
+        # through tabulate, which knows how to measure ANSI-coded cells.
+        self._use_fast_grid = not (
+            self._format_header or self._format_column or self._format_cell
+        )
+        if self._use_fast_grid:
+            widths = [len(cell) + 2 for cell in self._formatted_headers]
+            widths[0] = max(
+                widths[0],
+                max((len(label) for label in self._formatted_var_col), default=0) + 2,
+            )
+            self._col_widths = widths
+            self._grid_top = "╒" + "╤".join("═" * w for w in widths) + "╕"
+            self._grid_head_sep = "╞" + "╪".join("═" * w for w in widths) + "╡"
+            self._grid_row_sep = "├" + "┼".join("─" * w for w in widths) + "┤"
+            self._grid_bottom = "╘" + "╧".join("═" * w for w in widths) + "╛"
+            self._grid_header = self._grid_row(self._formatted_headers)
+
+    def _grid_row(self, cells):
+        """Build one bordered row from pre-padded cell strings."""
+        return (
+            "│"
+            + "│".join(
+                f" {cell} ".ljust(width)
+                for cell, width in zip(cells, self._col_widths)
+            )
+            + "│"
+        )
+
+    def _render_cell(self, value):
+        """Render one data cell: format the raw value, then fit the column.
+
+        Formatting runs on the raw value so numeric specs see the number,
+        not a padded string; the result is then padded to the column. ANSI
+        styling is re-wrapped around the padded body so the escape codes
+        are never measured or truncated.
+        """
+        if self._format_cell is None:
+            return self._truncate_or_pad(value, self.data_column_width)
+        cell = self._format_cell(value)
+        prefix = getattr(self.cell_format, "_ansi_prefix", "")
+        if prefix and cell.startswith(prefix):
+            suffix = self.cell_format._ansi_suffix
+            body = cell[len(prefix) : len(cell) - len(suffix)]
+            return prefix + self._truncate_or_pad(body, self.data_column_width) + suffix
+        return self._truncate_or_pad(cell, self.data_column_width)
 
     def update(self, var, header, value):
         """Update the table data for a specific variable and header."""
-        if header in self.headers:
-            header_index = self.headers.index(header)
-            self.data[var][header_index] = value
+        if header in self._header_index:
+            row, col = self._var_index[var], self._header_index[header]
+            self._data[row, col] = value
+            # Render from the stored cell so dtype coercion shows through.
+            self._cells[row][col] = self._render_cell(self._data[row, col])
+
+    def update_by_index(self, row, col, value):
+        """Fast-path update for callers that already hold array indices.
+
+        Skips even the dict lookups of update(); indices follow the
+        constructor's variables/headers order.
+        """
+        self._data[row, col] = value
+        self._cells[row][col] = self._render_cell(self._data[row, col])
+
+    def bulk_update(self, variables, headers, values):
+        """Update multiple cells in a single vectorized assignment."""
+        rows = [self._var_index[var] for var in variables]
+        cols = [self._header_index[header] for header in headers]
+        self._data[rows, cols] = values
+        cells = self._cells
+        render_cell = self._render_cell
+        data = self._data
+        for row, col in zip(rows, cols):
+            cells[row][col] = render_cell(data[row, col])
 
     def _truncate_or_pad(self, text, width):
         """Ensure text fits within the specified width."""
@@ -435,13 +673,22 @@ class Table(MonitorElement):
 
     def display(self):
         """Render the table for display."""
-        centered_headers = [
-            self._truncate_or_pad(header, self.data_column_width)
-            for header in self.headers
-        ]
-        formatted_headers = self.format_row("", centered_headers)
-        rows = [self.format_row(var, self.data[var]) for var in self.variables]
-        return tabulate(rows, headers=formatted_headers, tablefmt="fancy_grid")
+        if not self._use_fast_grid:
+            rows = [
+                [label] + cells
+                for label, cells in zip(self._formatted_var_col, self._cells)
+            ]
+            return tabulate(rows, headers=self._formatted_headers, tablefmt="fancy_grid")
+        grid_row = self._grid_row
+        row_sep = self._grid_row_sep
+        parts = [self._grid_top, self._grid_header, self._grid_head_sep]
+        append = parts.append
+        for label, cells in zip(self._formatted_var_col, self._cells):
+            if len(parts) > 3:
+                append(row_sep)
+            append(grid_row([label] + cells))
+        append(self._grid_bottom)
+        return "\n".join(parts)
 
     def get_height(self):
         """Calculate the height of the table."""
@@ -480,8 +727,12 @@ class LogMonitor(MonitorElement):
         """
         super().__init__(element_id, border=border, width=width, enabled=enabled)
         self.max_logs = max_logs
-        self.logs = []
+        # deque with maxlen evicts the oldest entry at C level; list.pop(0)
+        # shifted every remaining log per append.
+        self.logs = deque(maxlen=max_logs)
         self.log_format = log_format
+        # Blank filler line computed once; display pads with references.
+        self._blank_line = " " * (self.width - 4)
         self.timestamp = timestamp
         self.timestamp_format = timestamp_format
         self.timestamp_significant_digits = timestamp_significant_digits
@@ -494,16 +745,16 @@ class LogMonitor(MonitorElement):
             timestamp = timestamp[: -self.timestamp_significant_digits]
             log = f"{timestamp} {log}"
         self.logs.append(log)
-        if len(self.logs) > self.max_logs:
-            self.logs.pop(0)
 
     def display(self):
         """Render the log monitor for display."""
-        formatted_logs = [log.ljust(self.width - 4) for log in self.logs]
-        while len(formatted_logs) < self.max_logs:
-            formatted_logs.append(" " * (self.width - 4))
-        content = "\n".join(formatted_logs)
-        return self.add_border(content)
+        lines = [log.ljust(self.width - 4) for log in self.logs]
+        missing = self.max_logs - len(lines)
+        if missing > 0:
+            lines.extend([self._blank_line] * missing)
+        if self.border:
+            return self._border_join(lines)
+        return "\n".join(lines)
 
 # Indicator lamp class
 class IndicatorLamp(MonitorElement):
@@ -555,8 +806,3 @@ class IndicatorLamp(MonitorElement):
     @property
     def value(self):
         return int(self.state)
-    
-
-if __name__ == "__main__":
-    # Example usage of the MonitorElement classes
-    monitor = MonitorGroup(monitor = "monitor")
@@ -3,6 +3,8 @@ import struct
 
 
 class SerialReader:
+    __slots__ = ("ser",)
+
     def __init__(self, serial_connection):
         self.ser = serial_connection
 
@@ -13,11 +15,42 @@ class SerialReader:
 
 
 class AppMonitorReader(SerialReader):
+    __slots__ = ("dict_encoding_map", "_handlers", "_residual", "_dec_table")
+
     SCALING_FACTOR = 1000  # Same scaling factor as on the Arduino
+    # Multiplying by the cached reciprocal is cheaper than dividing per packet.
+    _INV_SCALE = 1.0 / SCALING_FACTOR
+
+    # Precompiled struct avoids re-parsing the format string per packet.
+    _FIXED_POINT = struct.Struct("<i")
 
     def __init__(self, serial_connection, dict_encoding_map=None):
         super().__init__(serial_connection)
         self.dict_encoding_map = dict_encoding_map or {}
+        # Dispatch table mapping the data-type byte to its decode handler;
+        # a dict lookup replaces the if/elif chain in the packet loop and
+        # keeps new data types O(1) to add.
+        self._handlers = {
+            0x01: self._decode_fixed_point,
+            0x02: self._decode_cstring,
+        }
+        # Trailing partial-packet bytes carried over to the next read.
+        self._residual = b""
+        # Flat 256-entry decode table: element IDs and params are always
+        # byte values, so decoding is a single list index instead of a
+        # method call plus dict.get per value.
+        self._dec_table = [self.dict_encoding_map.get(i, i) for i in range(256)]
+
+    def _decode_fixed_point(self, raw_data, buf, index):
+        """Decode a fixed-point integer payload; return (value, next_index)."""
+        fixed_point_value = self._FIXED_POINT.unpack_from(buf, index)[0]
+        return fixed_point_value * self._INV_SCALE, index + self._FIXED_POINT.size
+
+    def _decode_cstring(self, raw_data, buf, index):
+        """Decode a null-terminated char array; return (value, next_index)."""
+        # bytes.index is a memchr-backed scan for the null terminator.
+        end = raw_data.index(0x00, index)
+        return bytes(buf[index:end]).decode("utf-8"), end + 1
 
     def decode_value(self, encoded_value):
         """
@@ -26,68 +59,86 @@ class AppMonitorReader(SerialReader):
         return self.dict_encoding_map.get(encoded_value, encoded_value)
 
     def read_data(self):
-        raw_data = super().read_data()
+        """Decode every complete packet in the buffer; return a list.
 
+        Partial trailing packets are stashed and re-parsed on the next
+        call, so bursts of framed packets are not discarded.
+        """
+        raw_data = super().read_data()
+        if self._residual:
+            raw_data = self._residual + (raw_data or b"")
+            self._residual = b""
         if not raw_data:
-            return
-
+            return []
+
+        # memoryview slicing is O(1); byte values and terminator scans below
+        # all run at C level rather than byte-at-a-time Python loops.
+        buf = memoryview(raw_data)
+        length = len(raw_data)
+        packets = []
+        # Hoist per-iteration attribute lookups out of the packet loop.
+        get_handler = self._handlers.get
+        decode_value = self._dec_table.__getitem__
+        process_data = self.process_data
+        append = packets.append
         index = 0
-        while index < len(raw_data):
-            if raw_data[index] == 0xAA:  # Start byte
-                index += 1
-
-                # Ensure we have enough bytes for the minimum packet length
-                if index + 6 > len(raw_data):
-                    print("Error: Incomplete packet.")
-                    return
-
-                # Extract element ID and data type
-                element_id = raw_data[index]
-                data_type = raw_data[index + 1]
-                index += 2
-
-                # Decode the value based on data type
-                if data_type == 0x01:  # Fixed-point integer type
-                    fixed_point_value = struct.unpack_from("<i", raw_data, index)[0]
-                    value = fixed_point_value / self.SCALING_FACTOR
-                    index += 4
-                elif data_type == 0x02:  # Char array type
-                    value = b""
-                    while index < len(raw_data) and raw_data[index] != 0x00:
-                        value += bytes([raw_data[index]])
-                        index += 1
-                    value = value.decode("utf-8")
-                    index += 1  # Skip null terminator
-                else:
-                    print(f"Error: Unknown data type {data_type}.")
-                    return
-
-                # Read params length and params
-                params_length = raw_data[index]
-                index += 1
-                params = []
-                for _ in range(params_length):
-                    if index < len(raw_data):
-                        params.append(raw_data[index])
-                        index += 1
-                    else:
-                        print("Error: Incomplete params data.")
-                        return
-
-                # Check for end byte
-                if index < len(raw_data) and raw_data[index] == 0xFF:
-                    index += 1  # Move past end byte
-                    data = {
-                        "element_id": self.decode_value(element_id),
-                        "value": value,
-                        "params": [self.decode_value(param) for param in params],
-                    }
-                    return self.process_data(data)
-                else:
-                    print("Error: End byte not found. Invalid packet.")
-            else:
+        while index < length:
+            if raw_data[index] != 0xAA:  # Start byte
                 print("Error: Start byte not found.")
                 break
+            packet_start = index
+            index += 1
+
+            # Ensure we have enough bytes for the minimum packet length
+            if index + 6 > length:
+                self._residual = raw_data[packet_start:]
+                break
+
+            # Extract element ID and data type
+            element_id = raw_data[index]
+            data_type = raw_data[index + 1]
+            index += 2
+
+            # Decode the value via the data-type dispatch table
+            handler = get_handler(data_type)
+            if handler is None:
+                print(f"Error: Unknown data type {data_type}.")
+                break
+            try:
+                value, index = handler(raw_data, buf, index)
+            except (ValueError, struct.error):
+                # Payload not fully buffered yet; retry on the next read.
+                self._residual = raw_data[packet_start:]
+                break
+
+            # Read params length and params
+            if index >= length:
+                self._residual = raw_data[packet_start:]
+                break
+            params_length = raw_data[index]
+            index += 1
+            if index + params_length > length:
+                self._residual = raw_data[packet_start:]
+                break
+            params = buf[index : index + params_length].tolist()
+            index += params_length
+
+            # Check for end byte
+            if index >= length:
+                self._residual = raw_data[packet_start:]
+                break
+            if raw_data[index] != 0xFF:
+                print("Error: End byte not found. Invalid packet.")
+                break
+            index += 1  # Move past end byte
+            data = {
+                "element_id": decode_value(element_id),
+                "value": value,
+                "params": [decode_value(param) for param in params],
+            }
+            append(process_data(data))
+
+        return packets
 
     def process_data(self, data):
         """
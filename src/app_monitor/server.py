@@ -1,32 +1,65 @@
 from abc import abstractmethod
 import asyncio
+import functools
+import os
+import re
+import threading
 import zmq
 import zmq.asyncio
 import serial
 import struct
-from collections import OrderedDict
 from .logger import logger
 
+# Default size of the reusable serial read scratch buffer.
+_SCRATCH_SIZE = 4096
+
 
 class UpdateServer:
     """Class to manage updates synchronously."""
 
+    # Slots make per-packet attribute access a fixed-offset load and drop
+    # the per-instance __dict__.
+    __slots__ = ("monitor_manager", "_update", "_update_many")
+
     def __init__(
         self,
         monitor_manager,
     ):
         self.monitor_manager = monitor_manager
+        # Bind the manager's update methods once; each packet then costs a
+        # LOAD_FAST-style slot read instead of two attribute lookups.
+        self._update = monitor_manager.update
+        self._update_many = monitor_manager.update_many
 
     def process_update(self, packet):
-        """Process updates received via message."""
+        """Process updates received via message.
+
+        Accepts either a mapping of element_id -> value or a text message
+        of the form "element_id value [value ...]".
+        """
 
         # logger.debug(f"Received packet: {packet}")
 
-        for element_id, value in packet.items():
+        if isinstance(packet, (str, bytes)):
+            if isinstance(packet, bytes):
+                packet = packet.decode("utf-8")
+            # One C-level split tokenizes the whole message; no per-part
+            # Python-level re-splitting.
+            tokens = packet.split()
+            if not tokens:
+                return
             try:
-                self.monitor_manager.update(element_id, value)
+                self._update(tokens[0], *tokens[1:])
             except Exception as e:
                 logger.error(f"Error processing update: {e}")
+            return
+
+        # Batch path: one call and one exception boundary per packet
+        # instead of per element.
+        try:
+            self._update_many(packet)
+        except Exception as e:
+            logger.error(f"Error processing update: {e}")
 
     @abstractmethod
     def start(self):
@@ -37,26 +70,187 @@ class UpdateServer:
 class ZeroMQUpdateServer(UpdateServer):
     """Class to manage updates via ZeroMQ PUB-SUB pattern asynchronously."""
 
-    def __init__(self, monitor_manager, host="localhost", port=5556):
+    __slots__ = ("host", "port", "context", "socket", "decoder")
+
+    def __init__(
+        self,
+        monitor_manager,
+        host="localhost",
+        port=5556,
+        conflate=False,
+        rcvhwm=None,
+        decoder=None,
+    ):
+        """
+        :param conflate: Keep only the newest queued message in-kernel;
+            older telemetry is dropped before it is ever received.
+        :param rcvhwm: Receive high-water mark (queued-message cap); 0
+            means unbounded. None leaves the ZMQ default of 1000.
+        :param decoder: Optional decoder (e.g. StructDecoder) for binary
+            payloads; without one, messages are parsed as text.
+        """
         super().__init__(monitor_manager)
         self.host = host
         self.port = port
+        self.decoder = decoder
         self.context = zmq.asyncio.Context()
         self.socket = self.context.socket(zmq.SUB)  # Subscriber socket
+        # Socket options must be set before connect to take effect.
+        if conflate:
+            self.socket.setsockopt(zmq.CONFLATE, 1)
+        if rcvhwm is not None:
+            self.socket.setsockopt(zmq.RCVHWM, rcvhwm)
         self.socket.connect(f"tcp://{self.host}:{self.port}")
         self.socket.setsockopt_string(zmq.SUBSCRIBE, "")  # Subscribe to all messages
 
+    def _bind_receive(self):
+        """Return (recv, process) callables for the configured wire format."""
+        decoder = self.decoder
+        if decoder is None:
+            return self.socket.recv_string, self.process_update
+
+        # Binary wire format: skip the utf-8 decode and text split
+        # entirely and unpack straight into (element_id, value) pairs.
+        # recv(copy=False) returns a zmq.Frame whose .buffer is a
+        # memoryview over the message, so no intermediate bytes object is
+        # built; unpack_from reads the view in place. The view must not
+        # be retained past this call — update_many consumes the pairs
+        # before the frame goes out of scope.
+        decode_pairs = decoder.decode_pairs
+        update_many = self._update_many
+
+        def process(frame):
+            try:
+                update_many(decode_pairs(frame.buffer))
+            except Exception as e:
+                logger.error(f"Error processing update: {e}")
+
+        return functools.partial(self.socket.recv, copy=False), process
+
+    async def start(self, workers=0):
+        """Start the ZeroMQ subscriber asynchronously.
+
+        :param workers: If nonzero, split receive and processing into a
+            tight producer plus this many consumer tasks over a bounded
+            queue, so slow element updates can't stall the socket drain.
+        """
+        logger.info(f"Subscribed to {self.host}:{self.port}")
+        if workers:
+            await self._start_pooled(workers)
+            return
+        # Bind hot attributes to locals once; LOAD_FAST beats repeated
+        # attribute lookups in the per-message loop.
+        socket_events = self.socket.get
+        recv_string, process_update = self._bind_receive()
+        # One batch list reused across wakeups; clear() keeps the
+        # allocation out of the steady-state loop.
+        batch = []
+        append = batch.append
+        while True:
+            # Await the first message, then drain whatever else is already
+            # queued so a burst costs one event-loop wakeup, not one per
+            # message.
+            append(await recv_string())
+            while socket_events(zmq.EVENTS) & zmq.POLLIN:
+                try:
+                    append(await recv_string(zmq.NOBLOCK))
+                except zmq.Again:
+                    break
+            for message in batch:
+                process_update(message)
+            batch.clear()
+
+    async def _start_pooled(self, workers, queue_size=256):
+        """Producer/consumer receive loop for high-volume bursts.
+
+        The producer only recv's into a bounded queue; backpressure is
+        applied there instead of piling messages up at the socket HWM.
+        """
+        recv, process_update = self._bind_receive()
+        inbound = asyncio.Queue(maxsize=queue_size)
+
+        async def consume():
+            get = inbound.get
+            task_done = inbound.task_done
+            while True:
+                process_update(await get())
+                task_done()
+
+        consumers = [asyncio.create_task(consume()) for _ in range(workers)]
+        put = inbound.put
+        try:
+            while True:
+                await put(await recv())
+        finally:
+            for task in consumers:
+                task.cancel()
+
+
+class ThreadedZeroMQUpdateServer(UpdateServer):
+    """ZeroMQ subscriber running its receive loop on a dedicated thread.
+
+    Skips the per-recv future plumbing of zmq.asyncio: a daemon thread
+    blocks in recv and hands each message to the event loop via
+    call_soon_threadsafe. Worth it when raw message throughput matters
+    more than keeping everything on one loop.
+    """
+
+    __slots__ = ("host", "port", "context", "socket", "decoder", "_thread")
+
+    def __init__(self, monitor_manager, host="localhost", port=5556, decoder=None):
+        super().__init__(monitor_manager)
+        self.host = host
+        self.port = port
+        self.decoder = decoder
+        self.context = zmq.Context.instance()
+        self.socket = self.context.socket(zmq.SUB)
+        self.socket.connect(f"tcp://{self.host}:{self.port}")
+        self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        self._thread = None
+
     async def start(self):
-        """Start the ZeroMQ subscriber asynchronously."""
+        """Start the receive thread; messages are processed on this loop."""
         logger.info(f"Subscribed to {self.host}:{self.port}")
+        loop = asyncio.get_running_loop()
+        self._thread = threading.Thread(target=self._rx_loop, args=(loop,), daemon=True)
+        self._thread.start()
+
+    def _rx_loop(self, loop):
+        decoder = self.decoder
+        if decoder is None:
+            recv = self.socket.recv_string
+            process = self.process_update
+        else:
+            recv = self.socket.recv
+            decode_pairs = decoder.decode_pairs
+            update_many = self._update_many
+
+            def process(message):
+                try:
+                    update_many(decode_pairs(message))
+                except Exception as e:
+                    logger.error(f"Error processing update: {e}")
+
+        call_soon = loop.call_soon_threadsafe
         while True:
-            message = await self.socket.recv_string()  # Non-blocking receive
-            self.process_update(message)
+            # Element updates run on the loop thread, so the manager never
+            # sees concurrent access; this thread only blocks in recv.
+            call_soon(process, recv())
 
 
 class SerialUpdateServer(UpdateServer):
     """Class to manage updates via a serial or ethernet connection asynchronously."""
 
+    __slots__ = (
+        "connection",
+        "decoder",
+        "validator",
+        "freshest_only",
+        "_buf",
+        "_scratch",
+        "_frame_size",
+    )
+
     def __init__(
         self,
         monitor_manager,
@@ -66,6 +260,7 @@ class SerialUpdateServer(UpdateServer):
         baudrate=9600,
         decoder=None,
         validator=None,
+        freshest_only=False,
     ):
         super().__init__(monitor_manager)
         if serial_instance:
@@ -77,6 +272,25 @@ class SerialUpdateServer(UpdateServer):
 
         self.decoder = decoder
         self.validator = validator
+        # Monitors usually only care about the newest reading; with
+        # freshest_only the fixed-frame drain skips straight to the last
+        # complete frame and discards the backlog.
+        self.freshest_only = freshest_only
+        # Ask the kernel to bypass the FTDI ~16 ms receive-coalescing
+        # window (ASYNC_LOW_LATENCY); silently unsupported elsewhere.
+        try:
+            self.connection.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+        # Persistent receive buffer; extend/del are in-place, avoiding the
+        # O(n^2) growth of repeated bytes concatenation.
+        self._buf = bytearray()
+        # Reusable scratch buffer for readinto(), so steady-state reads
+        # allocate nothing; grown on demand for oversized bursts.
+        self._scratch = bytearray(_SCRATCH_SIZE)
+        # Validators for fixed-length protocols expose frame_size; reading
+        # whole frames avoids pyserial's byte-at-a-time readline scan.
+        self._frame_size = getattr(validator, "frame_size", None)
 
     def detect_devices(
         self,
@@ -84,20 +298,24 @@ class SerialUpdateServer(UpdateServer):
         pattern: str = "/dev/tty*",
         baudrate=9600,
     ):
+        directory = os.path.dirname(pattern) or "/dev"
+        prefix = os.path.basename(pattern).rstrip("*")
+        matcher = re.compile(search, re.IGNORECASE)
 
-        def find_devices(search, pattern):
-            import glob
-            import re
-
-            # List all files matching the pattern /dev/tty*
-            files = glob.glob(pattern)
-
-            # Filter files that contain 'usb'
-            devices = [f for f in files if re.search(search, f)]
-
-            return devices
-
-        if devices := find_devices(search, pattern):
+        def find_devices():
+            # One scandir pass replaces glob's scan-plus-fnmatch.
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                return []
+            with entries:
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.name.startswith(prefix) and matcher.search(entry.name)
+                ]
+
+        if devices := find_devices():
             for device in devices:
                 try:
                     serial_device = serial.Serial(port=device, baudrate=baudrate)
@@ -105,24 +323,148 @@ class SerialUpdateServer(UpdateServer):
                 except Exception as e:
                     logger.error(f"Error connecting to {device}: {e}")
 
+    def _drain(self):
+        """Read, validate, decode and dispatch any waiting data."""
+        waiting = self.connection.in_waiting
+        if not waiting:
+            return
+        readinto = getattr(self.connection, "readinto", None)
+        if readinto is not None:
+            scratch = self._scratch
+            if waiting > len(scratch):
+                scratch = bytearray(waiting)
+                # Only keep an enlarged scratch within reason; a one-off
+                # burst shouldn't pin a huge buffer for the process life.
+                if waiting <= 4 * _SCRATCH_SIZE:
+                    self._scratch = scratch
+            read = readinto(memoryview(scratch)[:waiting])
+            if not read:
+                return
+            self._buf.extend(memoryview(scratch)[:read])
+        else:
+            data = self.connection.read(waiting)
+            if not data:
+                return
+            self._buf.extend(data)
+        if self._frame_size:
+            if self.freshest_only:
+                # Older bytes can never be dispatched in freshest-only
+                # mode, so the buffer is bounded at two frames of tail;
+                # the start-byte resync realigns after the trim.
+                keep = 2 * self._frame_size
+                excess = len(self._buf) - keep
+                if excess > 0:
+                    del self._buf[:excess]
+            self._drain_frames()
+            return
+        # Only the complete prefix (up to the last newline) is parsed; the
+        # still-growing tail stays buffered for the next read.
+        last = self._buf.rfind(b"\n")
+        if last < 0:
+            return
+        complete = bytes(self._buf[: last + 1])
+        del self._buf[: last + 1]
+        for line in complete.splitlines():
+            if line:
+                self._dispatch(line)
+
+    def _drain_frames(self):
+        """Dispatch fixed-size frames from the receive buffer."""
+        size = self._frame_size
+        start_byte = getattr(self.validator, "start_byte", None)
+        if start_byte is not None and self._buf and self._buf[0] != start_byte:
+            # Resynchronize on the next start byte (C-level scan).
+            first = self._buf.find(start_byte)
+            if first < 0:
+                self._buf.clear()
+                return
+            del self._buf[:first]
+        if self.freshest_only:
+            while True:
+                complete = len(self._buf) // size
+                if not complete:
+                    return
+                offset = (complete - 1) * size
+                # The freshest frame's position is known arithmetically, so
+                # a single byte compare at that offset replaces any sentinel
+                # scan; only a mismatch (mid-buffer corruption) pays for a
+                # resync find, after which the check is retried.
+                if start_byte is not None and self._buf[offset] != start_byte:
+                    first = self._buf.find(start_byte, 1)
+                    if first < 0:
+                        self._buf.clear()
+                        return
+                    del self._buf[:first]
+                    continue
+                frame = bytes(self._buf[offset : offset + size])
+                del self._buf[: offset + size]
+                self._dispatch(frame)
+                return
+        while len(self._buf) >= size:
+            frame = bytes(self._buf[:size])
+            del self._buf[:size]
+            self._dispatch(frame)
+
+    def _dispatch(self, data):
+        """Run one framed message through the validate/decode pipeline."""
+        if self.validator or self.decoder:
+            # Hand the pipeline a memoryview so validator framing and
+            # decoder unpacking slice without copying.
+            data = memoryview(data)
+        if self.validator:
+            data = self.validator.validate(data)
+        if self.decoder and data:
+            # Pair iterables flow straight into update_many with no
+            # per-packet dict materialized.
+            data = self.decoder.decode_pairs(data)
+        if data:
+            self.process_update(data)
+
     async def start(self, frequency: float = 30):
-        """Start the reader asynchronously by polling the connection."""
+        """Start the reader asynchronously.
+
+        On POSIX the serial file descriptor is registered with the event
+        loop so the coroutine only wakes when data actually arrives;
+        platforms without add_reader support fall back to polling the
+        connection at `frequency`.
+        """
         if frequency <= 0:
             raise ValueError("Frequency must be greater than 0.")
         if not self.connection.is_open:
             raise RuntimeError("Connection is not open.")
 
+        loop = asyncio.get_running_loop()
         try:
-            while True:
-                if self.connection.in_waiting:
-                    if data := self.connection.readline():
-                        if self.validator:
-                            data = self.validator.validate(data)
-                        if self.decoder and data:
-                            data = self.decoder.decode(data)
-                        if data:
-                            self.process_update(data)
-                await asyncio.sleep(1 / frequency)
+            fd = None
+            data_ready = asyncio.Event()
+            try:
+                fd = self.connection.fileno()
+                loop.add_reader(fd, data_ready.set)
+            except (NotImplementedError, ValueError, OSError):
+                fd = None
+
+            # Bind loop-invariant callables to locals.
+            drain = self._drain
+            sleep = asyncio.sleep
+            if fd is None:
+                # Polling fallback (e.g. Windows event loops). The drain
+                # runs in the default executor so a stalling serial read
+                # cannot block the event loop.
+                interval = 1 / frequency
+                run_in_executor = loop.run_in_executor
+                while True:
+                    await run_in_executor(None, drain)
+                    await sleep(interval)
+            else:
+                wait = data_ready.wait
+                clear = data_ready.clear
+                try:
+                    while True:
+                        await wait()
+                        clear()
+                        drain()
+                finally:
+                    loop.remove_reader(fd)
 
         except Exception as e:
             logger.error(f"Error in connection: {e}")
@@ -135,46 +477,106 @@ class SerialUpdateServer(UpdateServer):
 
 
 class Decoder:
+    __slots__ = ()
+
     @abstractmethod
     def decode(self, packet): ...
 
+    def decode_pairs(self, packet):
+        """Decode to an iterable of (element_id, value) pairs.
+
+        Hot-path variant that lets subclasses skip building a dict per
+        packet; the default delegates to decode().
+        """
+        decoded = self.decode(packet)
+        return decoded.items() if hasattr(decoded, "items") else decoded
+
 
 class OrderedDecoder(Decoder):
     """Class to decode packets based on ordered keys."""
 
-    def __init__(self, keys, separator=","):
+    __slots__ = ("keys", "separator", "_convert")
+
+    def __init__(self, keys, separator=",", convert=None, scale=None):
+        """
+        Args:
+            keys (list): Ordered element IDs the values map onto.
+            convert (Callable): Optional per-value converter (e.g. float).
+            scale (float): Optional scale factor; implies float conversion.
+        """
         self.keys = keys
         self.separator = separator
+        # Specialize the converter once at construction so the per-packet
+        # path is a plain map() with no branching per value.
+        if scale is not None:
+            base = convert or float
+            factor = float(scale)
+
+            def convert(value, _base=base, _factor=factor):
+                return _base(value) * _factor
+
+        self._convert = convert
 
     def decode(self, packet):
-        data = packet.decode("utf-8").strip().split(self.separator)
-        return OrderedDict(zip(self.keys, data))
+        # str(buffer, encoding) accepts bytes and memoryview alike.
+        data = str(packet, "utf-8").strip().split(self.separator)
+        if self._convert:
+            data = map(self._convert, data)
+        # Builtin dict preserves insertion order and constructs ~2x faster
+        # than OrderedDict.
+        return dict(zip(self.keys, data))
+
+    def decode_pairs(self, packet):
+        data = str(packet, "utf-8").strip().split(self.separator)
+        if self._convert:
+            data = map(self._convert, data)
+        return zip(self.keys, data)
 
 
 class StructDecoder(Decoder):
+    __slots__ = ("packet_format", "_struct", "data_keys")
+
     def __init__(self, data_keys, packet_format=None):
         self.packet_format = packet_format
-        self.data_keys = data_keys
+        # Compile the format once; unpack_from skips per-call format parsing.
+        self._struct = struct.Struct(packet_format) if packet_format else None
+        self.data_keys = tuple(data_keys) if data_keys else None
 
     def decode(self, packet):
-        if self.packet_format:
-            packet = struct.unpack(self.packet_format, packet)
+        if self._struct:
+            packet = self._struct.unpack_from(packet)
         if self.data_keys:
-            packet = OrderedDict(zip(self.data_keys, packet))
+            packet = dict(zip(self.data_keys, packet))
+        return packet
+
+    def decode_pairs(self, packet):
+        if self._struct:
+            packet = self._struct.unpack_from(packet)
+        if self.data_keys:
+            return zip(self.data_keys, packet)
         return packet
 
 
 class Validator:
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, packet): ...
 
 
 class WindowValidator(Validator):
+    __slots__ = ("window_size", "start_byte", "end_byte")
+
     def __init__(self, window_size=10, start_byte=0xA5, end_byte=0x5A):
         self.window_size = window_size
         self.start_byte = start_byte
         self.end_byte = end_byte
 
+    @property
+    def frame_size(self):
+        """Fixed on-wire frame length, enabling whole-frame serial reads."""
+        return self.window_size
+
     def validate(self, packet):
         if (
             len(packet) == self.window_size
@@ -184,3 +586,28 @@ class WindowValidator(Validator):
             # Return packet without start and end bytes
             return packet[1:-1]
         return False
+
+    def scan(self, buf):
+        """Resynchronize on a raw buffer and return aligned frame payloads.
+
+        Uses the memchr-backed bytes.find to locate start bytes, so
+        misaligned streams are re-framed without a per-byte Python loop.
+        Returns a list of memoryview payloads (start/end bytes stripped).
+        """
+        if not isinstance(buf, (bytes, bytearray)):
+            buf = bytes(buf)
+        view = memoryview(buf)
+        payloads = []
+        find = buf.find
+        length = len(buf)
+        i = 0
+        while True:
+            i = find(self.start_byte, i)
+            if i < 0 or i + self.window_size > length:
+                break
+            if buf[i + self.window_size - 1] == self.end_byte:
+                payloads.append(view[i + 1 : i + self.window_size - 1])
+                i += self.window_size
+            else:
+                i += 1
+        return payloads
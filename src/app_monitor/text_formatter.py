@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,10 +11,13 @@ def get_length(value: Any):
         return 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextFormat:
     """
     Data class for specifying text formatting options.
+
+    Frozen so instances are hashable and safely shareable between
+    elements; the precompiled ANSI strings can never go stale.
     """
 
     width: int = None
@@ -26,6 +30,34 @@ class TextFormat:
     dim: bool = False
     padding: str = " "  # Default padding character is a space
 
+    def __post_init__(self):
+        # The ANSI escape prefix depends only on init-time fields, so it
+        # is resolved once here instead of being rebuilt per format call.
+        prefix = (
+            _compile_ansi_prefix(self.fg_color, self.bg_color, self.bold, self.dim)
+            if self.ansi_enabled
+            else ""
+        )
+        # Computed attributes bypass the frozen guard via object.__setattr__.
+        set_attr = object.__setattr__
+        set_attr(self, "_ansi_prefix", prefix)
+        set_attr(self, "_ansi_suffix", "\033[0m" if prefix else "")
+        # With no layout and no styling, formatting reduces to the numeric
+        # str() conversion; flag it so format_text can skip the formatter.
+        set_attr(
+            self,
+            "_is_noop",
+            not prefix
+            and self.width is None
+            and self.precision is None
+            and not self.force_sign,
+        )
+        # One-deep memo: displays mostly re-render unchanged values, so
+        # the previous result is returned without re-formatting. Keyed on
+        # type as well as value so e.g. 0 and 0.0 don't collide.
+        set_attr(self, "_last_in", None)
+        set_attr(self, "_last_out", None)
+
     def format_text(self, text):
         """
         Format the given text using either ANSI or basic text formatting.
@@ -36,18 +68,19 @@ class TextFormat:
         Returns:
             str: The formatted text or number.
         """
-        if self.ansi_enabled:
-            formatter = ANSITextFormatter(
-                text,
-                fg_color=self.fg_color,
-                bg_color=self.bg_color,
-                bold=self.bold,
-                dim=self.dim,
-                width=self.width,
-                precision=self.precision,
-                force_sign=self.force_sign,
-                padding=self.padding,
-            )
+        key = (type(text), text)
+        if key == self._last_in:
+            return self._last_out
+        if self._is_noop:
+            # Fast path preserving only the numeric conversion semantics:
+            # numeric strings still render via float, as the full path does.
+            if isinstance(text, str):
+                try:
+                    formatted = str(float(text))
+                except ValueError:
+                    formatted = text
+            else:
+                formatted = str(text)
         else:
             formatter = TextFormatter(
                 text,
@@ -56,7 +89,12 @@ class TextFormat:
                 force_sign=self.force_sign,
                 padding=self.padding,
             )
-        return formatter.format_text()
+            formatted = formatter.format_text()
+            if self._ansi_prefix:
+                formatted = f"{self._ansi_prefix}{formatted}{self._ansi_suffix}"
+        object.__setattr__(self, "_last_in", key)
+        object.__setattr__(self, "_last_out", formatted)
+        return formatted
 
 
 class TextFormatter:
@@ -64,6 +102,11 @@ class TextFormatter:
     A class for basic text and number formatting.
     """
 
+    # Formatters are built per format call in places, so slots keep the
+    # churn cheap: no per-instance __dict__ and faster attribute reads.
+    __slots__ = ("text", "width", "precision", "force_sign", "padding",
+                 "_spec", "_int_spec")
+
     def __init__(self, text, width=None, precision=None, force_sign=False, padding=" "):
         """
         Initialize the TextFormatter.
@@ -80,6 +123,30 @@ class TextFormatter:
         self.precision = precision
         self.force_sign = force_sign
         self.padding = padding
+        # Precompile the numeric format spec: one C-level format() call
+        # replaces the per-call sign/padding string assembly. A fill
+        # character with '=' alignment pads between sign and digits, which
+        # matches the manual sign-first layout for non-space padding.
+        if precision is not None:
+            sign = "+" if force_sign else "-"
+            if width is None:
+                self._spec = f"{sign}.{precision}f"
+            elif padding == " ":
+                self._spec = f"{sign}{width}.{precision}f"
+            else:
+                self._spec = f"{padding}={sign}{width}.{precision}f"
+        else:
+            self._spec = None
+        # Integer fast path for precision-less counters and states: a
+        # cached 'd' spec replaces str() plus the manual sign/padding
+        # assembly. Built with the same layout rules as the float spec.
+        sign = "+" if force_sign else "-"
+        if width is None:
+            self._int_spec = f"{sign}d"
+        elif padding == " ":
+            self._int_spec = f"{sign}{width}d"
+        else:
+            self._int_spec = f"{padding}={sign}{width}d"
 
     def format_text(self):
         """
@@ -97,6 +164,12 @@ class TextFormatter:
 
         # Format numbers with specified parameters
         if isinstance(self.text, (int, float)):
+            if self._spec is not None:
+                return format(self.text, self._spec)
+            # type check (not isinstance) so bool keeps its str() rendering.
+            if type(self.text) is int:
+                return format(self.text, self._int_spec)
+
             sign_char = ""
             if self.force_sign or self.text < 0:
                 sign_char = "+" if self.text >= 0 else "-"
@@ -104,11 +177,7 @@ class TextFormatter:
                     self.text
                 )  # Work with the absolute value for formatting
 
-            if self.precision is None:
-                formatted_number = str(self.text)
-            else:
-                # Build the number formatting specification
-                formatted_number = f"{self.text:.{self.precision}f}"
+            formatted_number = str(self.text)
 
             sign_len = get_length(sign_char)
             num_len = get_length(formatted_number)
@@ -138,6 +207,8 @@ class ANSITextFormatter(TextFormatter):
     A class for formatting text with ANSI color and style codes.
     """
 
+    __slots__ = ("fg_color", "bg_color", "bold", "dim", "_ansi_code", "_exit_code")
+
     COLORS = {
         "black": ("30", "40"),
         "red": ("31", "41"),
@@ -151,6 +222,11 @@ class ANSITextFormatter(TextFormatter):
 
     STYLES = {"bold": "1", "dim": "2"}
 
+    # Flat per-channel views of COLORS: one dict lookup yields the final
+    # code, with no tuple indexing or fg/bg branching.
+    FG = {name: codes[0] for name, codes in COLORS.items()}
+    BG = {name: codes[1] for name, codes in COLORS.items()}
+
     def __init__(
         self,
         text,
@@ -184,6 +260,11 @@ class ANSITextFormatter(TextFormatter):
         self.bg_color = bg_color
         self.bold = bold
         self.dim = dim
+        # Shared memoized prefix: elements that build a formatter per
+        # render (e.g. indicator lamps) hit the cache instead of redoing
+        # the COLORS/STYLES resolution and join.
+        self._ansi_code = _compile_ansi_prefix(fg_color, bg_color, bold, dim)
+        self._exit_code = "\033[0m" if self._ansi_code else ""
 
     def _get_code(self, type_, color):
         """
@@ -198,8 +279,8 @@ class ANSITextFormatter(TextFormatter):
         """
         if color is None:
             return ""
-        color = color.lower()
-        return self.COLORS.get(color, (None, None))[0 if type_ == "fg" else 1]
+        table = self.FG if type_ == "fg" else self.BG
+        return table.get(color.lower(), "")
 
     def format_text(self):
         """
@@ -208,26 +289,33 @@ class ANSITextFormatter(TextFormatter):
         Returns:
             str: The formatted text with ANSI codes.
         """
-        # Format the text using the base class method
+        # Format the text using the base class method, then wrap it in the
+        # escape codes resolved at construction time.
         formatted_text = super().format_text()
+        return f"{self._ansi_code}{formatted_text}{self._exit_code}"
+
 
-        # Apply ANSI styling
-        codes = []
-        if self.bold:
-            codes.append(self.STYLES["bold"])
-        if self.dim:
-            codes.append(self.STYLES["dim"])
-        if self.fg_color:
-            codes.append(self._get_code("fg", self.fg_color))
-        if self.bg_color:
-            codes.append(self._get_code("bg", self.bg_color))
-
-        # Remove any None values from the codes list
-        codes = [code for code in codes if code]
-        # Construct the ANSI code string
-        ansi_code = f"\033[{';'.join(codes)}m" if codes else ""
-        exit_code = "\033[0m" if codes else ""
-        return f"{ansi_code}{formatted_text}{exit_code}"
+@functools.lru_cache(maxsize=256)
+def _compile_ansi_prefix(fg_color, bg_color, bold, dim):
+    """Build (and memoize) the ANSI escape prefix for a style tuple.
+
+    Dashboards use a handful of styles across many cells, so every
+    combination is resolved exactly once. Returns "" when unstyled.
+    """
+    codes = []
+    if bold:
+        codes.append(ANSITextFormatter.STYLES["bold"])
+    if dim:
+        codes.append(ANSITextFormatter.STYLES["dim"])
+    if fg_color:
+        fg = ANSITextFormatter.FG.get(fg_color.lower())
+        if fg:
+            codes.append(fg)
+    if bg_color:
+        bg = ANSITextFormatter.BG.get(bg_color.lower())
+        if bg:
+            codes.append(bg)
+    return f"\033[{';'.join(codes)}m" if codes else ""
 
 
 # Example usage
@@ -11,6 +11,7 @@ from app_monitor.elements_base import (
 )
 
 from app_monitor.elements_advanced import MachineState
+from app_monitor.text_formatter import TextFormat
 
 
 def test_monitor_element_initialization():
@@ -56,6 +57,15 @@ def test_range_bar_update_and_display():
     assert "50.00" in display
 
 
+def test_range_bar_narrow_width_display():
+    range_bar = RangeBar(min_value=0, max_value=100, label="Range", width=25)
+    range_bar.update(50)
+    display = range_bar.display()
+    assert "Range" in display
+    assert "[|]" in display
+    assert "50.00" in display
+
+
 def test_table_update_and_display():
     table = Table(headers=["Col1", "Col2"], variables=["Var1", "Var2"])
     table.update("Var1", "Col1", 100)
@@ -67,6 +77,18 @@ def test_table_update_and_display():
     assert "200" in display
 
 
+def test_table_styled_headers_not_truncated():
+    fmt = TextFormat(ansi_enabled=True, fg_color="green", bold=True)
+    table = Table(headers=["1s", "10s"], variables=["rpm"], header_format=fmt)
+    for header in table._formatted_headers[1:]:
+        assert header.startswith("\033[")
+        assert header.endswith("\033[0m")
+        assert "..." not in header
+    display = table.display()
+    assert "1s" in display
+    assert "10s" in display
+
+
 def test_log_monitor_update_and_display():
     log_monitor = LogMonitor(max_logs=3, timestamp=False)
     log_monitor.update("First log")